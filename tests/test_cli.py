@@ -0,0 +1,66 @@
+"""
+This file tests the CLI helpers that read task files and run coroutines.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from trae_agent.cli import run_coroutine
+from trae_agent.cli_commands.run import _read_task_file
+
+
+class TestReadTaskFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_regular_file(self):
+        path = os.path.join(self.temp_dir.name, "task.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Fix the bug ✓")
+        self.assertEqual(_read_task_file(path), "Fix the bug ✓")
+
+    def test_directory(self):
+        self.assertIsNone(_read_task_file(self.temp_dir.name))
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "requires os.mkfifo")
+    def test_fifo_does_not_block(self):
+        path = os.path.join(self.temp_dir.name, "task.fifo")
+        os.mkfifo(path)
+        result: list[str | None] = []
+        reader = threading.Thread(
+            target=lambda: result.append(_read_task_file(path)), daemon=True
+        )
+        reader.start()
+        reader.join(timeout=5)
+        self.assertFalse(reader.is_alive(), "_read_task_file blocked on a FIFO")
+        self.assertEqual(result, [None])
+
+    def test_nul_byte(self):
+        self.assertIsNone(_read_task_file("fix\0the bug"))
+
+
+class TestRunCoroutine(unittest.TestCase):
+    def test_leftover_tasks_are_cancelled_between_runs(self):
+        background: list[asyncio.Task[None]] = []
+
+        async def leave_task_behind():
+            background.append(asyncio.create_task(asyncio.sleep(60)))
+
+        async def check_background():
+            return background[0].cancelled()
+
+        with asyncio.Runner() as runner:
+            _ = run_coroutine(leave_task_behind(), runner)
+            self.assertTrue(background[0].cancelled())
+            self.assertTrue(run_coroutine(check_background(), runner))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+This file tests configuration loading and that configuration problems are reported as ConfigError.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from trae_agent.cli import _resolve_api_key, load_config, read_config
+from trae_agent.utils.config import ConfigError, ModelParameters
+from trae_agent.utils.openai_client import OpenAIClient
+
+
+class TestConfigError(unittest.TestCase):
+    def test_unknown_provider(self):
+        with self.assertRaises(ConfigError):
+            load_config(provider="not_a_provider", config_file="missing.json")
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": ""})
+    def test_missing_api_key(self):
+        model_parameters = ModelParameters(
+            "gpt-4o", "", 1000, 0.5, 1.0, 0, False, 1, None, None
+        )
+        with self.assertRaises(ConfigError):
+            OpenAIClient(model_parameters)
+
+    def test_is_value_error(self):
+        self.assertTrue(issubclass(ConfigError, ValueError))
+
+
+class TestLoadConfig(unittest.TestCase):
+    def setUp(self):
+        fd, self.config_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.write_config(max_steps=10)
+
+    def tearDown(self):
+        os.remove(self.config_file)
+
+    def write_config(self, max_steps: int | str):
+        config = {
+            "default_provider": "openai",
+            "max_steps": max_steps,
+            "model_providers": {
+                "openai": {
+                    "api_key": "config-key",
+                    "model": "gpt-4o",
+                    "max_tokens": 1000,
+                    "temperature": 0.5,
+                    "top_p": 1,
+                    "top_k": 0,
+                    "parallel_tool_calls": False,
+                    "max_retries": 1,
+                }
+            },
+        }
+        with open(self.config_file, "w") as f:
+            json.dump(config, f)
+
+    def test_edited_file_is_reparsed(self):
+        self.assertEqual(read_config(self.config_file).max_steps, 10)
+        self.write_config(max_steps=30)
+        # Bump the mtime explicitly in case both writes land in the same tick
+        mtime_ns = os.stat(self.config_file).st_mtime_ns + 1_000_000_000
+        os.utime(self.config_file, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(read_config(self.config_file).max_steps, 30)
+
+    def test_overrides_do_not_leak_into_cache(self):
+        config = load_config(
+            model="gpt-4o-mini", config_file=self.config_file, max_steps=None
+        )
+        config.max_steps = 99
+        config.model_providers["openai"].temperature = 0.0
+
+        config = load_config(config_file=self.config_file, max_steps=None)
+        self.assertEqual(config.max_steps, 10)
+        self.assertEqual(config.model_providers["openai"].model, "gpt-4o")
+        self.assertEqual(config.model_providers["openai"].temperature, 0.5)
+
+    def test_string_max_steps_is_converted(self):
+        self.write_config(max_steps="5")
+        config = load_config(config_file=self.config_file, max_steps=None)
+        self.assertEqual(config.max_steps, 5)
+
+
+class TestResolveApiKey(unittest.TestCase):
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "env-key"})
+    def test_cli_key_wins(self):
+        self.assertEqual(
+            _resolve_api_key("cli-key", "config-key", "OPENAI_API_KEY"), "cli-key"
+        )
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "env-key"})
+    def test_env_key_beats_config(self):
+        self.assertEqual(
+            _resolve_api_key(None, "config-key", "OPENAI_API_KEY"), "env-key"
+        )
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": ""})
+    def test_config_key_is_fallback(self):
+        self.assertEqual(
+            _resolve_api_key(None, "config-key", "OPENAI_API_KEY"), "config-key"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
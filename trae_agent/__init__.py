@@ -3,11 +3,32 @@
 
 """Trae Agent - LLM-based agent for general purpose software engineering tasks."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .agent.base import Agent
-from .agent.trae_agent import TraeAgent
-from .tools.base import Tool, ToolExecutor
-from .utils.llm_client import LLMClient
+if TYPE_CHECKING:
+    from .agent.base import Agent
+    from .agent.trae_agent import TraeAgent
+    from .tools.base import Tool, ToolExecutor
+    from .utils.llm_client import LLMClient
 
 __all__ = ["Agent", "TraeAgent", "LLMClient", "Tool", "ToolExecutor"]
+
+# Public names are resolved on first access so that importing a submodule such
+# as ``trae_agent.cli`` does not pull in every LLM provider SDK.
+_lazy_exports = {
+    "Agent": ".agent.base",
+    "TraeAgent": ".agent.trae_agent",
+    "LLMClient": ".utils.llm_client",
+    "Tool": ".tools.base",
+    "ToolExecutor": ".tools.base",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _lazy_exports:
+        module = importlib.import_module(_lazy_exports[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
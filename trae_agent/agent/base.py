@@ -4,15 +4,19 @@
 """Base Agent class for LLM-based agents."""
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from ..tools.base import Tool, ToolExecutor, ToolResult
-from ..utils.cli_console import CLIConsole
 from ..utils.config import Config, ModelParameters
 from ..utils.llm_basics import LLMMessage, LLMResponse
 from ..utils.llm_client import LLMClient
 from ..utils.trajectory_recorder import TrajectoryRecorder
 from .agent_basics import AgentExecution, AgentState, AgentStep
 
+if TYPE_CHECKING:
+    # cli_console imports agent_basics, which would make this import circular
+    from ..utils.cli_console import CLIConsole
+
 
 class Agent(ABC):
     """Base class for LLM-based agents."""
@@ -30,7 +34,7 @@ class Agent(ABC):
         self.tools: list[Tool] = []
         self.tool_caller: ToolExecutor = ToolExecutor([])
 
-        self.cli_console: CLIConsole | None = None
+        self.cli_console: "CLIConsole | None" = None
 
         # Trajectory recorder
         self.trajectory_recorder: TrajectoryRecorder | None = None
@@ -41,7 +45,7 @@ class Agent(ABC):
         # Also set it on the LLM client
         self.llm_client.set_trajectory_recorder(recorder)
 
-    def set_cli_console(self, cli_console: CLIConsole | None) -> None:
+    def set_cli_console(self, cli_console: "CLIConsole | None") -> None:
         """Set the CLI console for this agent."""
         self.cli_console = cli_console
 
@@ -6,6 +6,7 @@
 import asyncio
 import os
 import subprocess
+from pathlib import Path
 from typing import override
 
 from ..tools import tools_registry
@@ -33,7 +34,9 @@ class TraeAgent(Agent):
         self.patch_path: str | None = None
         super().__init__(config)
 
-    def setup_trajectory_recording(self, trajectory_path: str | None = None) -> str:
+    def setup_trajectory_recording(
+        self, trajectory_path: str | Path | None = None
+    ) -> str:
         """Set up trajectory recording for this agent.
 
         Args:
@@ -3,34 +3,109 @@
 
 """Command Line Interface for Trae Agent."""
 
-import asyncio
+from __future__ import annotations
+
+import copy
+import functools
+import importlib
 import os
 import sys
-import traceback
-from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn, override
 
 import click
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from trae_agent.utils.cli_console import CLIConsole
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Runner
+    from collections.abc import Coroutine
+    from pathlib import Path
+
+    from rich.console import Console
+
+    from .agent import TraeAgent
+    from .utils.config import Config, ConfigError
+
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Return the shared rich Console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+# Map providers to their environment variable names
+_ENV_VAR_MAP = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "azure": "AZURE_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "doubao": "DOUBAO_API_KEY",
+    "google": "GOOGLE_API_KEY",
+}
+
+_DOTENV_LOADED = False
 
-from .agent import TraeAgent
-from .utils.config import Config, resolve_config_value
 
-# Load environment variables
-_ = load_dotenv()
+def _ensure_dotenv() -> None:
+    """Load environment variables from .env once per process."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        _ = load_dotenv()
+        _DOTENV_LOADED = True
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_file: str | Path, mtime_ns: int) -> Config:
+    """Parse config_file; mtime_ns is part of the cache key so edits are picked up."""
+    from .utils.config import Config
+
+    return Config(config_file)
+
+
+def read_config(config_file: str | Path) -> Config:
+    """
+    read_config returns the parsed configuration file, reusing earlier parses of the same unmodified file.
+    The returned object is shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _load_config_cached(config_file, mtime_ns)
+
 
-console = Console()
+def _coalesce[T](*values: T | None) -> T | None:
+    """Return the first value that is not None."""
+    return next((value for value in values if value is not None), None)
+
+
+def _resolve_api_key(
+    cli_key: str | None, config_key: str | None, env_var: str | None
+) -> str | None:
+    """Resolve the API key with priority: CLI > ENV > Config, reading the environment once."""
+    if cli_key is not None:
+        return cli_key
+    env_key = os.environ.get(env_var) if env_var else None
+    return env_key or config_key
+
+
+def has_api_key(provider: str, config_key: str | None) -> bool:
+    """Return whether provider has an API key in the config file or its environment variable."""
+    _ensure_dotenv()
+    return bool(_resolve_api_key(None, config_key, _ENV_VAR_MAP.get(provider)))
 
 
 def load_config(
     provider: str | None = None,
     model: str | None = None,
     api_key: str | None = None,
-    config_file: str = "trae-config-local.json",
+    config_file: str | Path = "trae-config-local.json",
     max_steps: int | None = 20,
 ) -> Config:
     """
@@ -44,51 +119,50 @@ def load_config(
 
     Return:
         Config Object
+    Raises:
+        ConfigError: if the resolved provider has no entry in the config file
     """
+    _ensure_dotenv()
 
-    config: Config = Config(config_file)
+    config = copy.deepcopy(read_config(config_file))
     # Resolve model provider
-    resolved_provider = (
-        resolve_config_value(provider, config.default_provider) or "openai"
-    )
-
-    config.default_provider = str(resolved_provider)
+    provider_key = _coalesce(provider, config.default_provider) or "openai"
+    config.default_provider = provider_key
+    if provider_key not in config.model_providers:
+        from .utils.config import ConfigError
+
+        raise ConfigError(
+            f"Provider '{provider_key}' is not configured in {config_file}. "
+            f"Configured providers: {', '.join(config.model_providers)}"
+        )
+    model_parameters = config.model_providers[provider_key]
 
     # Resolve configuration values with CLI overrides
-    resolved_model = resolve_config_value(
-        model, config.model_providers[str(resolved_provider)].model
-    )
-
-    model_parameters = config.model_providers[str(resolved_provider)]
+    resolved_model = _coalesce(model, model_parameters.model)
     if resolved_model is not None:
-        model_parameters.model = str(resolved_model)
-
-    # Map providers to their environment variable names
-    env_var_map = {
-        "openai": "OPENAI_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "azure": "AZURE_API_KEY",
-        "openrouter": "OPENROUTER_API_KEY",
-        "doubao": "DOUBAO_API_KEY",
-        "google": "GOOGLE_API_KEY",
-    }
+        model_parameters.model = resolved_model
 
-    resolved_api_key = resolve_config_value(
-        api_key,
-        config.model_providers[str(resolved_provider)].api_key,
-        env_var_map.get(str(resolved_provider)),
+    resolved_api_key = _resolve_api_key(
+        api_key, model_parameters.api_key, _ENV_VAR_MAP.get(provider_key)
     )
 
     if resolved_api_key is not None:
         # If None shall we stop the program ?
-        model_parameters.api_key = str(resolved_api_key)
+        model_parameters.api_key = resolved_api_key
 
-    resolved_max_steps = resolve_config_value(max_steps, config.max_steps)
+    resolved_max_steps = _coalesce(max_steps, config.max_steps)
     if resolved_max_steps is not None:
+        # The config file may give max_steps as a string
         config.max_steps = int(resolved_max_steps)
     return config
 
 
+def report_config_error(error: ConfigError) -> NoReturn:
+    """Print a known configuration problem without a traceback and exit with status 2."""
+    get_console().print(f"[red]Configuration error: {error}[/red]")
+    sys.exit(2)
+
+
 def create_agent(config: Config) -> TraeAgent:
     """
     create_agent creates a Trae Agent with the specified configuration.
@@ -97,316 +171,86 @@ def create_agent(config: Config) -> TraeAgent:
     Return:
         TraeAgent object
     """
+    from .agent import TraeAgent
+    from .utils.config import ConfigError
+
     try:
         # Create agent
         agent = TraeAgent(config)
         return agent
 
+    except ConfigError as e:
+        report_config_error(e)
     except Exception as e:
-        console.print(f"[red]Error creating agent: {e}[/red]")
-        console.print(traceback.format_exc())
-        sys.exit(1)
-
-
-# Display functions moved to agent/base.py for real-time progress display
-
-
-@click.group()
-@click.version_option(version="0.1.0")
-def cli():
-    """Trae Agent - LLM-based agent for software engineering tasks."""
-    pass
-
-
-@cli.command()
-@click.argument("task")
-@click.option("--provider", "-p", help="LLM provider to use")
-@click.option("--model", "-m", help="Specific model to use")
-@click.option("--api-key", "-k", help="API key (or set via environment variable)")
-@click.option("--max-steps", help="Maximum number of execution steps", type=int)
-@click.option("--working-dir", "-w", help="Working directory for the agent")
-@click.option("--must-patch", "-mp", is_flag=True, help="Whether to patch the code")
-@click.option(
-    "--config-file", help="Path to configuration file", default="trae_config.json"
-)
-@click.option("--trajectory-file", "-t", help="Path to save trajectory file")
-@click.option("--patch-path", "-pp", help="Path to patch file")
-def run(
-    task: str,
-    patch_path: str,
-    provider: str | None = None,
-    model: str | None = None,
-    api_key: str | None = None,
-    max_steps: int | None = None,
-    working_dir: str | None = None,
-    must_patch: bool = False,
-    config_file: str = "trae_config.json",
-    trajectory_file: str | None = None,
-):
-    """
-    Run is the main function of tace. It runs a task using Trae Agent.
-    Args:
-        tasks: the task that you want your agent to solve. This is required to be in the input
-        model: the model expected to be use
-        working_dir: the working directory of the agent. This should be set either in cli or inf the config file (trae_config.json)
+        import traceback
 
-    Return:
-        None (it is expected to be ended after calling the run function)
-    """
+        get_console().print(f"[red]Error creating agent: {e}[/red]")
+        get_console().print(traceback.format_exc())
+        sys.exit(1)
 
-    # Change working directory if specified
-    if not working_dir:
-        working_dir = os.getcwd()
-        try:
-            os.chdir(working_dir)
-            console.print(f"[blue]Changed working directory to: {working_dir}[/blue]")
-        except Exception as e:
-            console.print(f"[red]Error changing directory: {e}[/red]")
-            sys.exit(1)
-
-    task_path = Path(task)
-    if task_path.exists() and task_path.is_file():
-        task = task_path.read_text()
-
-    config = load_config(provider, model, api_key, config_file, max_steps)
-
-    # Create agent
-    agent: TraeAgent = create_agent(config)
-
-    # Set up trajectory recording
-    trajectory_path = None
-    if trajectory_file:
-        trajectory_path = agent.setup_trajectory_recording(trajectory_file)
-    else:
-        trajectory_path = agent.setup_trajectory_recording()
-
-    # Create CLI Console
-    cli_console = CLIConsole(config)
-    cli_console.print_task_details(
-        task,
-        working_dir,
-        config.default_provider,
-        config.model_providers[config.default_provider].model,
-        config.max_steps,
-        config_file,
-        trajectory_path,
-    )
 
-    agent.set_cli_console(cli_console)
+def _cancel_pending_tasks(loop: AbstractEventLoop) -> None:
+    """Cancel the tasks still pending on loop and wait for them to finish."""
+    import asyncio
 
-    try:
-        task_args = {
-            "project_path": working_dir,
-            "issue": task,
-            "must_patch": "true" if must_patch else "false",
-            "patch_path": patch_path,
-        }
-        agent.new_task(task, task_args)
-        _ = asyncio.run(agent.execute_task())
-
-        console.print(f"\n[green]Trajectory saved to: {trajectory_path}[/green]")
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Task execution interrupted by user[/yellow]")
-        if trajectory_path:
-            console.print(
-                f"[blue]Partial trajectory saved to: {trajectory_path}[/blue]"
-            )
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"\n[red]Unexpected error: {e}[/red]")
-        console.print(traceback.format_exc())
-        if trajectory_path:
-            console.print(f"[blue]Trajectory saved to: {trajectory_path}[/blue]")
-        sys.exit(1)
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not tasks:
+        return
+    for task in tasks:
+        _ = task.cancel()
+    _ = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
 
 
-@cli.command()
-@click.option("--provider", "-p", help="LLM provider to use")
-@click.option("--model", "-m", help="Specific model to use")
-@click.option("--api-key", "-k", help="API key (or set via environment variable)")
-@click.option(
-    "--config-file", help="Path to configuration file", default="trae_config.json"
-)
-@click.option(
-    "--max-steps", help="Maximum number of execution steps", type=int, default=20
-)
-@click.option("--trajectory-file", "-t", help="Path to save trajectory file")
-def interactive(
-    provider: str | None = None,
-    model: str | None = None,
-    api_key: str | None = None,
-    config_file: str = "trae_config.json",
-    max_steps: int | None = None,
-    trajectory_file: str | None = None,
-):
+def run_coroutine[T](
+    coro: Coroutine[object, object, T], runner: Runner | None = None
+) -> T:
     """
-    This function starts an interactive session with Trae Agent.
-    Args:
-        tasks: the task that you want your agent to solve. This is required to be in the input
+    run_coroutine runs coro to completion on runner.
+    Tasks that coro leaves pending (e.g. after Ctrl-C) are cancelled so they cannot resume
+    during the runner's next call. Without a runner, coro is run with asyncio.run.
     """
-    config = load_config(
-        provider, model, api_key, config_file=config_file, max_steps=max_steps
-    )
-
-    console.print(
-        Panel(
-            f"""[bold]Welcome to Trae Agent Interactive Mode![/bold]
-    [bold]Provider:[/bold] {config.default_provider}
-    [bold]Model:[/bold] {config.model_providers[config.default_provider].model}
-    [bold]Max Steps:[/bold] {config.max_steps}
-    [bold]Config File:[/bold] {config_file}""",
-            title="Interactive Mode",
-            border_style="green",
-        )
-    )
-
-    # Create agent
-    agent = create_agent(config)
-
-    while True:
+    if runner is not None:
         try:
-            console.print("\n[bold blue]Task:[/bold blue] ", end="")
-            task = input()
-
-            if task.lower() in ["exit", "quit"]:
-                console.print("[green]Goodbye![/green]")
-                break
-
-            if task.lower() == "help":
-                console.print(
-                    Panel(
-                        """[bold]Available Commands:[/bold]
-
-• Type any task description to execute it
-• 'status' - Show agent status
-• 'clear' - Clear the screen
-• 'exit' or 'quit' - End the session""",
-                        title="Help",
-                        border_style="yellow",
-                    )
-                )
-                continue
-
-            console.print("\n[bold blue]Working Directory:[/bold blue] ", end="")
-            working_dir = input()
-
-            if task.lower() == "status":
-                console.print(
-                    Panel(
-                        f"""[bold]Provider:[/bold] {agent.llm_client.provider.value}
-    [bold]Model:[/bold] {config.model_providers[config.default_provider].model}
-    [bold]Available Tools:[/bold] {len(agent.tools)}
-    [bold]Config File:[/bold] {config_file}
-    [bold]Working Directory:[/bold] {os.getcwd()}""",
-                        title="Agent Status",
-                        border_style="blue",
-                    )
-                )
-                continue
-
-            if task.lower() == "clear":
-                console.clear()
-                continue
-
-            # Set up trajectory recording for this task
-            trajectory_path = agent.setup_trajectory_recording(trajectory_file)
-
-            console.print(
-                f"[blue]Trajectory will be saved to: {trajectory_path}[/blue]"
-            )
-
-            task_args = {
-                "project_path": working_dir,
-                "issue": task,
-                "must_patch": "false",
-            }
-
-            # Execute the task
-            console.print(f"\n[blue]Executing task: {task}[/blue]")
-            agent.new_task(task, task_args)
-
-            # Configure agent for progress display
-            _ = asyncio.run(agent.execute_task())
-
-            console.print(f"\n[green]Trajectory saved to: {trajectory_path}[/green]")
-
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Use 'exit' or 'quit' to end the session[/yellow]")
-        except EOFError:
-            console.print("\n[green]Goodbye![/green]")
-            break
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-
-
-@cli.command()
-@click.option(
-    "--config-file", help="Path to configuration file", default="trae_config.json"
-)
-def show_config(config_file: str):
-    """Show current configuration settings."""
-    config_path = Path(config_file)
-    if not config_path.exists():
-        console.print(
-            Panel(
-                f"""[yellow]No configuration file found at: {config_file}[/yellow]
-
-Using default settings and environment variables.""",
-                title="Configuration Status",
-                border_style="yellow",
-            )
-        )
+            return runner.run(coro)
+        finally:
+            _cancel_pending_tasks(runner.get_loop())
 
-    config = Config(config_file)
+    import asyncio
 
-    # Display general settings
-    general_table = Table(title="General Settings")
-    general_table.add_column("Setting", style="cyan")
-    general_table.add_column("Value", style="green")
+    return asyncio.run(coro)
 
-    general_table.add_row("Default Provider", str(config.default_provider or "Not set"))
-    general_table.add_row("Max Steps", str(config.max_steps or "Not set"))
 
-    console.print(general_table)
-
-    # Display provider settings
-    for provider_name, provider_config in config.model_providers.items():
-        provider_table = Table(title=f"{provider_name.title()} Configuration")
-        provider_table.add_column("Setting", style="cyan")
-        provider_table.add_column("Value", style="green")
+# Display functions moved to agent/base.py for real-time progress display
 
-        provider_table.add_row("Model", provider_config.model or "Not set")
-        provider_table.add_row(
-            "API Key", "Set" if provider_config.api_key else "Not set"
-        )
-        provider_table.add_row("Max Tokens", str(provider_config.max_tokens))
-        provider_table.add_row("Temperature", str(provider_config.temperature))
-        provider_table.add_row("Top P", str(provider_config.top_p))
 
-        if provider_name == "anthropic":
-            provider_table.add_row("Top K", str(provider_config.top_k))
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is invoked."""
 
-        console.print(provider_table)
+    _commands: dict[str, str] = {
+        "run": "run",
+        "interactive": "interactive",
+        "show-config": "show_config",
+        "tools": "tools",
+    }
 
+    @override
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(self._commands)
 
-@cli.command()
-def tools():
-    """Show available tools and their descriptions."""
-    from .tools import tools_registry
+    @override
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        module_name = self._commands.get(cmd_name)
+        if module_name is None:
+            return None
+        module = importlib.import_module(f"trae_agent.cli_commands.{module_name}")
+        return module.cli
 
-    tools_table = Table(title="Available Tools")
-    tools_table.add_column("Tool Name", style="cyan")
-    tools_table.add_column("Description", style="green")
 
-    for tool_name in tools_registry:
-        try:
-            tool = tools_registry[tool_name]()
-            tools_table.add_row(tool.name, tool.description)
-        except Exception as e:
-            tools_table.add_row(tool_name, f"[red]Error loading: {e}[/red]")
-
-    console.print(tools_table)
+@click.command(cls=LazyGroup)
+@click.version_option(package_name="trae-agent")
+def cli():
+    """Trae Agent - LLM-based agent for software engineering tasks."""
+    pass
 
 
 def main():
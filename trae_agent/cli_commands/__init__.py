@@ -0,0 +1,4 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""Subcommands of the Trae Agent CLI, imported on demand by ``trae_agent.cli``."""
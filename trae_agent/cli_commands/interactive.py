@@ -0,0 +1,236 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The ``interactive`` command of the Trae Agent CLI."""
+
+from __future__ import annotations
+
+import functools
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from ..agent import TraeAgent
+    from ..utils.config import Config
+
+
+_WELCOME_TEMPLATE = """[bold]Welcome to Trae Agent Interactive Mode![/bold]
+    [bold]Provider:[/bold] {provider}
+    [bold]Model:[/bold] {model}
+    [bold]Max Steps:[/bold] {max_steps}
+    [bold]Config File:[/bold] {config_file}"""
+
+_STATUS_TEMPLATE = """[bold]Provider:[/bold] {provider}
+    [bold]Model:[/bold] {model}
+    [bold]Available Tools:[/bold] {tools}
+    [bold]Config File:[/bold] {config_file}
+    [bold]Working Directory:[/bold] {cwd}"""
+
+_HELP_TEXT = """[bold]Available Commands:[/bold]
+
+• Type any task description to execute it
+• 'status' - Show agent status
+• 'clear' - Clear the screen
+• 'exit' or 'quit' - End the session"""
+
+
+@functools.cache
+def _help_panel() -> Panel:
+    """Build the help panel once; rich is only imported when it is first shown."""
+    from rich.panel import Panel
+
+    return Panel(_HELP_TEXT, title="Help", border_style="yellow")
+
+
+@dataclass
+class _Session:
+    """State shared by the built-in commands of an interactive session."""
+
+    console: Console
+    agent: TraeAgent
+    config: Config
+    model_name: str
+    config_file: Path
+    cwd: str
+
+
+def _exit(session: _Session) -> bool:
+    session.console.print("[green]Goodbye![/green]")
+    return True
+
+
+def _help(session: _Session) -> bool:
+    session.console.print(_help_panel())
+    return False
+
+
+def _status(session: _Session) -> bool:
+    from rich.panel import Panel
+
+    session.console.print(
+        Panel(
+            _STATUS_TEMPLATE.format(
+                provider=session.agent.llm_client.provider.value,
+                model=session.model_name,
+                tools=len(session.agent.tools),
+                config_file=session.config_file,
+                cwd=session.cwd,
+            ),
+            title="Agent Status",
+            border_style="blue",
+        )
+    )
+    return False
+
+
+def _clear(session: _Session) -> bool:
+    session.console.clear()
+    return False
+
+
+# Built-in session commands; a handler returns True to end the session
+_HANDLERS: dict[str, Callable[[_Session], bool]] = {
+    "exit": _exit,
+    "quit": _exit,
+    "help": _help,
+    "status": _status,
+    "clear": _clear,
+}
+
+
+@click.command("interactive")
+@click.option("--provider", "-p", help="LLM provider to use")
+@click.option("--model", "-m", help="Specific model to use")
+@click.option("--api-key", "-k", help="API key (or set via environment variable)")
+@click.option(
+    "--config-file",
+    help="Path to configuration file",
+    default="trae_config.json",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--max-steps", help="Maximum number of execution steps", type=int, default=20
+)
+@click.option(
+    "--trajectory-file",
+    "-t",
+    help="Path to save trajectory file",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+def cli(
+    provider: str | None = None,
+    model: str | None = None,
+    api_key: str | None = None,
+    config_file: Path = Path("trae_config.json"),
+    max_steps: int | None = None,
+    trajectory_file: Path | None = None,
+):
+    """
+    This function starts an interactive session with Trae Agent.
+    Args:
+        tasks: the task that you want your agent to solve. This is required to be in the input
+    """
+    import asyncio
+    import contextlib
+
+    with contextlib.suppress(ImportError):
+        # Enables line editing and history for input()
+        import readline  # noqa: F401
+
+    from rich.panel import Panel
+
+    from ..cli import (
+        create_agent,
+        get_console,
+        load_config,
+        report_config_error,
+        run_coroutine,
+    )
+    from ..utils.config import ConfigError
+
+    console = get_console()
+    cwd = os.getcwd()
+
+    try:
+        config = load_config(
+            provider, model, api_key, config_file=config_file, max_steps=max_steps
+        )
+    except ConfigError as e:
+        report_config_error(e)
+    model_name = config.model_providers[config.default_provider].model
+
+    console.print(
+        Panel(
+            _WELCOME_TEMPLATE.format(
+                provider=config.default_provider,
+                model=model_name,
+                max_steps=config.max_steps,
+                config_file=config_file,
+            ),
+            title="Interactive Mode",
+            border_style="green",
+        )
+    )
+
+    # Create agent
+    agent = create_agent(config)
+    session = _Session(console, agent, config, model_name, config_file, cwd)
+
+    # Reuse a single event loop for every task in the session; the runner cancels the
+    # running task on Ctrl-C and is closed however the session ends
+    with asyncio.Runner() as runner:
+        while True:
+            try:
+                console.print("\n[bold blue]Task:[/bold blue] ", end="")
+                task = input()
+
+                handler = _HANDLERS.get(task.strip().lower())
+                if handler:
+                    if handler(session):
+                        break
+                    continue
+
+                console.print("\n[bold blue]Working Directory:[/bold blue] ", end="")
+                working_dir = input()
+
+                # Set up trajectory recording for this task
+                trajectory_path = agent.setup_trajectory_recording(trajectory_file)
+
+                console.print(
+                    f"[blue]Trajectory will be saved to: {trajectory_path}[/blue]"
+                )
+
+                task_args = {
+                    "project_path": working_dir,
+                    "issue": task,
+                    "must_patch": "false",
+                }
+
+                # Execute the task
+                console.print(f"\n[blue]Executing task: {task}[/blue]")
+                agent.new_task(task, task_args)
+
+                # Configure agent for progress display
+                _ = run_coroutine(agent.execute_task(), runner)
+
+                console.print(
+                    f"\n[green]Trajectory saved to: {trajectory_path}[/green]"
+                )
+
+            except KeyboardInterrupt:
+                console.print(
+                    "\n[yellow]Use 'exit' or 'quit' to end the session[/yellow]"
+                )
+            except EOFError:
+                console.print("\n[green]Goodbye![/green]")
+                break
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
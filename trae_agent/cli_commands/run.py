@@ -0,0 +1,151 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The ``run`` command of the Trae Agent CLI."""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import click
+
+
+def _read_task_file(task: str) -> str | None:
+    """Return the contents of the regular UTF-8 file named by task, or None."""
+    try:
+        # O_NONBLOCK keeps open() from waiting for a writer when task names a FIFO
+        fd = os.open(task, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except (OSError, ValueError):
+        return None
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        with os.fdopen(fd, "rb", closefd=False) as f:
+            return f.read().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    finally:
+        os.close(fd)
+
+
+@click.command("run")
+@click.argument("task")
+@click.option("--provider", "-p", help="LLM provider to use")
+@click.option("--model", "-m", help="Specific model to use")
+@click.option("--api-key", "-k", help="API key (or set via environment variable)")
+@click.option("--max-steps", help="Maximum number of execution steps", type=int)
+@click.option("--working-dir", "-w", help="Working directory for the agent")
+@click.option("--must-patch", "-mp", is_flag=True, help="Whether to patch the code")
+@click.option(
+    "--config-file",
+    help="Path to configuration file",
+    default="trae_config.json",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--trajectory-file",
+    "-t",
+    help="Path to save trajectory file",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option("--patch-path", "-pp", help="Path to patch file")
+def cli(
+    task: str,
+    patch_path: str,
+    provider: str | None = None,
+    model: str | None = None,
+    api_key: str | None = None,
+    max_steps: int | None = None,
+    working_dir: str | None = None,
+    must_patch: bool = False,
+    config_file: Path = Path("trae_config.json"),
+    trajectory_file: Path | None = None,
+):
+    """
+    Run is the main function of tace. It runs a task using Trae Agent.
+    Args:
+        tasks: the task that you want your agent to solve. This is required to be in the input
+        model: the model expected to be use
+        working_dir: the working directory of the agent. This should be set either in cli or inf the config file (trae_config.json)
+
+    Return:
+        None (it is expected to be ended after calling the run function)
+    """
+    from ..cli import (
+        create_agent,
+        get_console,
+        load_config,
+        report_config_error,
+        run_coroutine,
+    )
+    from ..utils.cli_console import CLIConsole
+    from ..utils.config import ConfigError
+
+    console = get_console()
+
+    # The agent works in the current directory unless --working-dir is given
+    if not working_dir:
+        working_dir = os.getcwd()
+
+    # A task that names a readable file is replaced by the file's contents
+    task_text = _read_task_file(task)
+    if task_text is not None:
+        task = task_text
+
+    try:
+        config = load_config(provider, model, api_key, config_file, max_steps)
+    except ConfigError as e:
+        report_config_error(e)
+
+    # Create agent
+    agent = create_agent(config)
+
+    # Set up trajectory recording
+    trajectory_path = None
+    if trajectory_file:
+        trajectory_path = agent.setup_trajectory_recording(trajectory_file)
+    else:
+        trajectory_path = agent.setup_trajectory_recording()
+
+    # Create CLI Console
+    cli_console = CLIConsole(config)
+    cli_console.print_task_details(
+        task,
+        working_dir,
+        config.default_provider,
+        config.model_providers[config.default_provider].model,
+        config.max_steps,
+        config_file,
+        trajectory_path,
+    )
+
+    agent.set_cli_console(cli_console)
+
+    try:
+        task_args = {
+            "project_path": working_dir,
+            "issue": task,
+            "must_patch": "true" if must_patch else "false",
+            "patch_path": patch_path,
+        }
+        agent.new_task(task, task_args)
+        _ = run_coroutine(agent.execute_task())
+
+        console.print(f"\n[green]Trajectory saved to: {trajectory_path}[/green]")
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Task execution interrupted by user[/yellow]")
+        if trajectory_path:
+            console.print(
+                f"[blue]Partial trajectory saved to: {trajectory_path}[/blue]"
+            )
+        sys.exit(1)
+    except Exception as e:
+        import traceback
+
+        console.print(f"\n[red]Unexpected error: {e}[/red]")
+        console.print(traceback.format_exc())
+        if trajectory_path:
+            console.print(f"[blue]Trajectory saved to: {trajectory_path}[/blue]")
+        sys.exit(1)
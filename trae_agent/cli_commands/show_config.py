@@ -0,0 +1,84 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The ``show-config`` command of the Trae Agent CLI."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+def _make_table(title: str, rows: list[tuple[str, str]]) -> "Table":
+    """Build a two-column settings table from precomputed rows."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="green")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+@click.command("show-config")
+@click.option(
+    "--config-file",
+    help="Path to configuration file",
+    default="trae_config.json",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--all",
+    "show_all",
+    is_flag=True,
+    help="Show every provider, including those without an API key",
+)
+def cli(config_file: Path, show_all: bool = False):
+    """Show current configuration settings."""
+    from rich.panel import Panel
+
+    from ..cli import get_console, has_api_key, read_config
+
+    console = get_console()
+
+    if not config_file.exists():
+        console.print(
+            Panel(
+                f"""[yellow]No configuration file found at: {config_file}[/yellow]
+
+Using default settings and environment variables.""",
+                title="Configuration Status",
+                border_style="yellow",
+            )
+        )
+
+    config = read_config(config_file)
+
+    # Display general settings
+    general_rows = [
+        ("Default Provider", str(config.default_provider or "Not set")),
+        ("Max Steps", str(config.max_steps or "Not set")),
+    ]
+    console.print(_make_table("General Settings", general_rows))
+
+    # Display provider settings; unconfigured providers are hidden unless --all
+    for provider_name, provider_config in config.model_providers.items():
+        api_key_set = has_api_key(provider_name, provider_config.api_key)
+        if not (show_all or api_key_set or provider_name == config.default_provider):
+            continue
+
+        rows = [
+            ("Model", provider_config.model or "Not set"),
+            ("API Key", "Set" if api_key_set else "Not set"),
+            ("Max Tokens", str(provider_config.max_tokens)),
+            ("Temperature", str(provider_config.temperature)),
+            ("Top P", str(provider_config.top_p)),
+        ]
+        if provider_name == "anthropic":
+            rows.append(("Top K", str(provider_config.top_k)))
+
+        console.print(_make_table(f"{provider_name.title()} Configuration", rows))
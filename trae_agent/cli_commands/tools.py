@@ -0,0 +1,29 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The ``tools`` command of the Trae Agent CLI."""
+
+import click
+
+
+@click.command("tools")
+def cli():
+    """Show available tools and their descriptions."""
+    from rich.table import Table
+
+    from ..cli import get_console
+    from ..tools import tools_registry
+
+    console = get_console()
+
+    tools_table = Table(title="Available Tools")
+    tools_table.add_column("Tool Name", style="cyan")
+    tools_table.add_column("Description", style="green")
+
+    for tool_name, tool_cls in tools_registry.items():
+        try:
+            tools_table.add_row(tool_cls.NAME, tool_cls.DESCRIPTION)
+        except Exception as e:
+            tools_table.add_row(tool_name, f"[red]Error loading: {e}[/red]")
+
+    console.print(tools_table)
@@ -7,7 +7,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import override
+from typing import ClassVar, override
 
 
 class ToolError(Exception):
@@ -73,6 +73,10 @@ class ToolParameter:
 class Tool(ABC):
     """Base class for all tools."""
 
+    # Static metadata, readable without instantiating the tool.
+    NAME: ClassVar[str]
+    DESCRIPTION: ClassVar[str]
+
     def __init__(self, model_provider: str | None = None):
         self._model_provider = model_provider
 
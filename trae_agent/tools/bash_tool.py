@@ -137,6 +137,16 @@ class BashTool(Tool):
     The tool parameters are defined by Anthropic and are not editable.
     """
 
+    NAME = "bash"
+    DESCRIPTION = """Run commands in a bash shell
+* When invoking this tool, the contents of the "command" parameter does NOT need to be XML-escaped.
+* You have access to a mirror of common linux and python packages via apt and pip.
+* State is persistent across command calls and discussions with the user.
+* To inspect a particular line range of a file, e.g. lines 10-25, try 'sed -n 10,25p /path/to/the/file'.
+* Please avoid commands that may produce a very large amount of output.
+* Please run long lived commands in the background, e.g. 'sleep 10 &' or start a server in the background.
+"""
+
     def __init__(self, model_provider: str | None = None):
         super().__init__(model_provider)
         self._session: _BashSession | None = None
@@ -147,18 +157,11 @@ class BashTool(Tool):
 
     @override
     def get_name(self) -> str:
-        return "bash"
+        return self.NAME
 
     @override
     def get_description(self) -> str:
-        return """Run commands in a bash shell
-* When invoking this tool, the contents of the "command" parameter does NOT need to be XML-escaped.
-* You have access to a mirror of common linux and python packages via apt and pip.
-* State is persistent across command calls and discussions with the user.
-* To inspect a particular line range of a file, e.g. lines 10-25, try 'sed -n 10,25p /path/to/the/file'.
-* Please avoid commands that may produce a very large amount of output.
-* Please run long lived commands in the background, e.g. 'sleep 10 &' or start a server in the background.
-"""
+        return self.DESCRIPTION
 
     @override
     def get_parameters(self) -> list[ToolParameter]:
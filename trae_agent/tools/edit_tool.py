@@ -27,6 +27,19 @@ SNIPPET_LINES: int = 4
 class TextEditorTool(Tool):
     """Tool to replace a string in a file."""
 
+    NAME = "str_replace_based_edit_tool"
+    DESCRIPTION = """Custom editing tool for viewing, creating and editing files
+* State is persistent across command calls and discussions with the user
+* If `path` is a file, `view` displays the result of applying `cat -n`. If `path` is a directory, `view` lists non-hidden files and directories up to 2 levels deep
+* The `create` command cannot be used if the specified `path` already exists as a file !!! If you know that the `path` already exists, please remove it first and then perform the `create` operation!
+* If a `command` generates a long output, it will be truncated and marked with `<response clipped>`
+
+Notes for using the `str_replace` command:
+* The `old_str` parameter should match EXACTLY one or more consecutive lines from the original file. Be mindful of whitespaces!
+* If the `old_str` parameter is not unique in the file, the replacement will not be performed. Make sure to include enough context in `old_str` to make it unique
+* The `new_str` parameter should contain the edited lines that should replace the `old_str`
+"""
+
     def __init__(self, model_provider: str | None = None) -> None:
         super().__init__(model_provider)
 
@@ -36,21 +49,11 @@ class TextEditorTool(Tool):
 
     @override
     def get_name(self) -> str:
-        return "str_replace_based_edit_tool"
+        return self.NAME
 
     @override
     def get_description(self) -> str:
-        return """Custom editing tool for viewing, creating and editing files
-* State is persistent across command calls and discussions with the user
-* If `path` is a file, `view` displays the result of applying `cat -n`. If `path` is a directory, `view` lists non-hidden files and directories up to 2 levels deep
-* The `create` command cannot be used if the specified `path` already exists as a file !!! If you know that the `path` already exists, please remove it first and then perform the `create` operation!
-* If a `command` generates a long output, it will be truncated and marked with `<response clipped>`
-
-Notes for using the `str_replace` command:
-* The `old_str` parameter should match EXACTLY one or more consecutive lines from the original file. Be mindful of whitespaces!
-* If the `old_str` parameter is not unique in the file, the replacement will not be performed. Make sure to include enough context in `old_str` to make it unique
-* The `new_str` parameter should contain the edited lines that should replace the `old_str`
-"""
+        return self.DESCRIPTION
 
     @override
     def get_parameters(self) -> list[ToolParameter]:
@@ -36,13 +36,8 @@ class SequentialThinkingTool(Tool):
     Each thought can build on, question, or revise previous insights as understanding deepens.
     """
 
-    @override
-    def get_name(self) -> str:
-        return "sequentialthinking"
-
-    @override
-    def get_description(self) -> str:
-        return """A detailed tool for dynamic and reflective problem-solving through thoughts.
+    NAME = "sequentialthinking"
+    DESCRIPTION = """A detailed tool for dynamic and reflective problem-solving through thoughts.
 This tool helps analyze problems through a flexible thinking process that can adapt and evolve.
 Each thought can build on, question, or revise previous insights as understanding deepens.
 
@@ -97,6 +92,14 @@ You should:
 10. Provide a single, ideally correct answer as the final output
 11. Only set next_thought_needed to false when truly done and a satisfactory answer is reached"""
 
+    @override
+    def get_name(self) -> str:
+        return self.NAME
+
+    @override
+    def get_description(self) -> str:
+        return self.DESCRIPTION
+
     @override
     def get_parameters(self) -> list[ToolParameter]:
         return [
@@ -9,6 +9,9 @@ from .base import Tool, ToolCallArguments, ToolExecResult, ToolParameter
 class TaskDoneTool(Tool):
     """Tool to mark a task as done."""
 
+    NAME = "task_done"
+    DESCRIPTION = "Report the completion of the task. Note that you cannot call this tool before any verification is done. You can write reproduce / test script to verify your solution."
+
     def __init__(self, model_provider: str | None = None) -> None:
         super().__init__(model_provider)
 
@@ -18,11 +21,11 @@ class TaskDoneTool(Tool):
 
     @override
     def get_name(self) -> str:
-        return "task_done"
+        return self.NAME
 
     @override
     def get_description(self) -> str:
-        return "Report the completion of the task. Note that you cannot call this tool before any verification is done. You can write reproduce / test script to verify your solution."
+        return self.DESCRIPTION
 
     @override
     def get_parameters(self) -> list[ToolParameter]:
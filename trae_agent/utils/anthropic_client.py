@@ -13,7 +13,7 @@ import anthropic
 from anthropic.types.tool_union_param import TextEditor20250429
 
 from ..tools.base import Tool, ToolCall, ToolResult
-from ..utils.config import ModelParameters
+from ..utils.config import ConfigError, ModelParameters
 from ..utils.llm_basics import LLMMessage, LLMResponse, LLMUsage
 from .base_client import BaseLLMClient
 
@@ -28,7 +28,7 @@ class AnthropicClient(BaseLLMClient):
             self.api_key: str = os.getenv("ANTHROPIC_API_KEY", "")
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "Anthropic API key not provided. Set ANTHROPIC_API_KEY in environment variables or config file."
             )
 
@@ -27,7 +27,7 @@ from openai.types.shared_params.function_definition import FunctionDefinition
 
 from ..tools.base import Tool, ToolCall
 from .base_client import BaseLLMClient
-from .config import ModelParameters
+from .config import ConfigError, ModelParameters
 from .llm_basics import LLMMessage, LLMResponse, LLMUsage
 
 
@@ -41,7 +41,7 @@ class AzureClient(BaseLLMClient):
             self.api_key: str = os.getenv("AZURE_API_KEY", "")
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "Azure API key not provided. Set AZURE_API_KEY in environment variables or config file."
             )
 
@@ -49,7 +49,7 @@ class AzureClient(BaseLLMClient):
             self.base_url: str | None = os.getenv("AZURE_API_BASE_URL")
 
         if self.base_url is None:
-            raise ValueError(
+            raise ConfigError(
                 "Azure API base url not provided. Set AZURE_API_BASE_URL in environment variables or config file."
             )
 
@@ -57,7 +57,7 @@ class AzureClient(BaseLLMClient):
             self.api_version: str | None = os.getenv("AZURE_API_VERSION")
 
         if self.api_version is None:
-            raise ValueError("Azure API version not provided. ")
+            raise ConfigError("Azure API version not provided. ")
 
         self.client: openai.AzureOpenAI = openai.AzureOpenAI(
             azure_endpoint=self.base_url,
@@ -3,6 +3,7 @@
 
 import asyncio
 from dataclasses import dataclass
+from pathlib import Path
 
 from rich.console import Console, Group
 from rich.live import Live
@@ -93,7 +94,7 @@ class CLIConsole:
         provider: str,
         model: str,
         max_steps: int,
-        config_file: str,
+        config_file: str | Path,
         trajectory_file: str,
     ):
         self.console.print(
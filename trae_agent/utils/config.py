@@ -15,6 +15,10 @@ from pathlib import Path
 from typing import Any, override
 
 
+class ConfigError(ValueError):
+    """Raised when the configuration is missing a required provider or credential."""
+
+
 # data class for model parameters
 @dataclass
 class ModelParameters:
@@ -52,7 +56,7 @@ class Config:
     lakeview_config: LakeviewConfig | None = None
     enable_lakeview: bool = True
 
-    def __init__(self, config_or_config_file: str | dict = "trae_config.json"):
+    def __init__(self, config_or_config_file: str | Path | dict = "trae_config.json"):
         # Accept either file path or direct config dict
         if isinstance(config_or_config_file, dict):
             self._config = config_or_config_file
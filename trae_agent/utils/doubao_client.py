@@ -27,7 +27,7 @@ from openai.types.shared_params.function_definition import FunctionDefinition
 
 from ..tools.base import Tool, ToolCall
 from .base_client import BaseLLMClient
-from .config import ModelParameters
+from .config import ConfigError, ModelParameters
 from .llm_basics import LLMMessage, LLMResponse, LLMUsage
 
 
@@ -41,7 +41,7 @@ class DoubaoClient(BaseLLMClient):
             self.api_key: str = os.getenv("DOUBAO_API_KEY", "")
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "Doubao API key not provided. Set DOUBAO_API_KEY in environment variables or config file."
             )
 
@@ -49,7 +49,7 @@ class DoubaoClient(BaseLLMClient):
             self.base_url: str | None = os.getenv("DOUBAO_API_BASE_URL")
 
         if self.base_url is None:
-            raise ValueError(
+            raise ConfigError(
                 "Doubao API base url not provided. Set DOUBAO_API_BASE_URL in environment variables or config file."
             )
 
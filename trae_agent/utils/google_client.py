@@ -16,7 +16,7 @@ from google.genai import types
 
 from ..tools.base import Tool, ToolCall, ToolResult
 from .base_client import BaseLLMClient
-from .config import ModelParameters
+from .config import ConfigError, ModelParameters
 from .llm_basics import LLMMessage, LLMResponse, LLMUsage
 
 
@@ -32,7 +32,7 @@ class GoogleClient(BaseLLMClient):
                 self.api_key = google_api_key
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "Google API key not provided. Set GOOGLE_API_KEY in environment variables or config file."
             )
 
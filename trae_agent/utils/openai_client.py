@@ -18,7 +18,7 @@ from openai.types.responses import (
 from openai.types.responses.response_input_param import FunctionCallOutput
 
 from ..tools.base import Tool, ToolCall, ToolResult
-from ..utils.config import ModelParameters
+from ..utils.config import ConfigError, ModelParameters
 from .base_client import BaseLLMClient
 from .llm_basics import LLMMessage, LLMResponse, LLMUsage
 
@@ -33,7 +33,7 @@ class OpenAIClient(BaseLLMClient):
             self.api_key: str = os.getenv("OPENAI_API_KEY", "")
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "OpenAI API key not provided. Set OPENAI_API_KEY in environment variables or config file."
             )
 
@@ -26,7 +26,7 @@ from openai.types.chat.chat_completion_tool_message_param import (
 from openai.types.shared_params.function_definition import FunctionDefinition
 
 from ..tools.base import Tool, ToolCall
-from ..utils.config import ModelParameters
+from ..utils.config import ConfigError, ModelParameters
 from .base_client import BaseLLMClient
 from .llm_basics import LLMMessage, LLMResponse, LLMUsage
 
@@ -41,7 +41,7 @@ class OpenRouterClient(BaseLLMClient):
             self.api_key: str = os.getenv("OPENROUTER_API_KEY", "")
 
         if self.api_key == "":
-            raise ValueError(
+            raise ConfigError(
                 "OpenRouter API key not provided. Set OPENROUTER_API_KEY in environment variables or config file."
             )
 
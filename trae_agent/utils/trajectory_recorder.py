@@ -20,7 +20,7 @@ from .llm_basics import LLMMessage, LLMResponse
 class TrajectoryRecorder:
     """Records trajectory data for agent execution and LLM interactions."""
 
-    def __init__(self, trajectory_path: str | None = None):
+    def __init__(self, trajectory_path: str | Path | None = None):
         """Initialize trajectory recorder.
 
         Args: